@@ -6,12 +6,12 @@ Complete with auto-reload functionality and detachable renderer.
 
 import                                  sys
 import                                  os
-import                                  psutil
-import                                  configparser
+import                                  importlib
+import                                  threading
+import                                  time
 from pathlib                    import Path
 from typing                     import Optional, Any
-from PyQt6.QtCore               import (Qt, QTimer, QSettings, 
-                                        QFileSystemWatcher, QDateTime, pyqtSlot)
+from PyQt6.QtCore               import (Qt, QTimer, QSettings, QDateTime, QEvent, pyqtSlot)
 from PyQt6.QtWidgets            import (
                                         QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                                         QPushButton, QLabel, QFrame, QFileDialog, QMenu,
@@ -21,12 +21,25 @@ from PyQt6.QtGui                import (QFont, QIcon, QAction)
 # custom classes
 from libs.Detachablerenderer    import DetachableRenderer
 from libs.Sourcevalidator       import SourceValidator
+from libs.Sourcewatcher         import SourceWatcher
 from libs.Safewidgetwrapper     import SafeWidgetWrapper
 from libs.stylesheetModefier    import StylesheetModifier
 from libs.Errorlogview          import ErrorLogView
 from libs.Databasconnector      import DatabaseConnector
 from libs.Globalenentfilter     import GlobalEventFilter
 
+# psutil / configparser are imported on first use to keep cold start short
+_psutil = None
+
+
+def _get_psutil():
+    global _psutil
+    if _psutil is None:
+        import psutil
+        _psutil = psutil
+    return _psutil
+
+
 # ----------------- Main Application -----------------
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -34,22 +47,54 @@ class MainWindow(QMainWindow):
         self.current_source: Optional[Path] = None
         self.current_module: Optional[Any] = None
         self.validator_thread: Optional[SourceValidator] = None
+        self._pending_validation: Optional[Path] = None
         self.hosted_widget: Optional[QWidget] = None
         self.raw_widget: Optional[QWidget] = None
+        self._cfg: Optional[Any] = None  # one ConfigParser, reused across loads
 
         self.styleSheet_mod = StylesheetModifier("src/styles.qss", self)
-        self.styleSheet_mod.apply_stylesheet()
 
-        self.file_watcher = QFileSystemWatcher()
-        self.last_modification: dict[str, float] = {}
+        self.file_watcher = SourceWatcher(self)
+        self._fw_connected = False
         self.reload_timer = QTimer()
         self.reload_timer.setSingleShot(True)
         self.reload_timer.setInterval(1500)
         self.reload_timer.timeout.connect(self.debounced_reload)
-
-        self.is_reloading = False
+        self._pending_changes: set[str] = set()
+        self._first_pending_change: Optional[float] = None  # monotonic seconds
+        self.reload_max_wait = 2.0  # flush a continuous change stream after this
+        self._last_event_ts: dict[str, float] = {}  # path -> monotonic seconds
+        # Re-arming after a reload restarts one owned timer instead of queueing more
+        self._rewatch_timer = QTimer(self)
+        self._rewatch_timer.setSingleShot(True)
+        self._rewatch_timer.setInterval(1000)
+        self._rewatch_timer.timeout.connect(self.enable_file_watching)
+        # Settle delay between the debounced flush and the actual reload
+        self._auto_reload_timer = QTimer(self)
+        self._auto_reload_timer.setSingleShot(True)
+        self._auto_reload_timer.setInterval(500)
+        self._auto_reload_timer.timeout.connect(self.perform_auto_reload)
+
+        # Held from debounced_reload until the validator finishes
+        self._reloading = threading.Lock()
         self.recent_files: list[Path] = []
 
+        # On Linux RSS is one read of /proc/self/statm, keep it open for the ticks
+        self._statm = None
+        self._page_size = 4096
+        if sys.platform.startswith("linux"):
+            try:
+                self._statm = open("/proc/self/statm", "rb", buffering=0)
+                self._page_size = os.sysconf("SC_PAGESIZE")
+            except (OSError, ValueError):
+                self._statm = None
+        # Runs only while the window is visible and active, see update_memory_timer
+        self.memory_timer = QTimer(self)
+        self.memory_timer.setInterval(5000)
+        # Coarse so Qt can batch the wakeup with other timers
+        self.memory_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self.memory_timer.timeout.connect(self.update_memory_usage)
+
         self.db = DatabaseConnector()
         self.db.create_tables_if_not_exist()
 
@@ -91,6 +136,9 @@ class MainWindow(QMainWindow):
         main_layout.addWidget(control_panel)
         main_layout.addStretch()
 
+        # Menu bar, toolbar and status bar all take space around the central
+        # widget, so they are built before the first paint; adding one later
+        # would shift the whole window
         self.create_menu_bar()
         self.create_toolbar()
         self.create_status_bar()
@@ -200,17 +248,20 @@ class MainWindow(QMainWindow):
         self.watcher_status_label = QLabel("🔒 No files watched")
         status_bar.addWidget(self.watcher_status_label)
         self.memory_label = QLabel("")
+        # Width reserved up front: the first reading comes when the window is
+        # shown (psutil is only imported then) and must not resize the bar
+        self.memory_label.setMinimumWidth(self.memory_label.fontMetrics().horizontalAdvance("🧠 00000.0 MB"))
         status_bar.addPermanentWidget(self.memory_label)
-        timer = QTimer()
-        timer.timeout.connect(self.update_memory_usage)
-        timer.start(5000)
-        self.update_memory_usage()
 
     def update_memory_usage(self):
         try:
-            mem = psutil.Process().memory_info().rss / 1024 / 1024
-            self.memory_label.setText(f"🧠 {mem:.1f} MB")
-        except ImportError:
+            if self._statm is not None:
+                self._statm.seek(0)
+                rss = int(self._statm.read().split()[1]) * self._page_size
+            else:
+                rss = _get_psutil().Process().memory_info().rss
+            self.memory_label.setText(f"🧠 {rss / 1024 / 1024:.1f} MB")
+        except (ImportError, OSError, ValueError, IndexError):
             self.memory_label.setText("🧠 N/A")
 
     def create_control_panel(self) -> QFrame:
@@ -267,7 +318,6 @@ class MainWindow(QMainWindow):
 
         layout.addWidget(self.error_view)
 
-
         return control_panel
 
     # ----------------- Connections -----------------
@@ -290,10 +340,13 @@ class MainWindow(QMainWindow):
             return
         self.db.insert_path(folder_path, self.get_curr_date_time())
 
+        if self._cfg is None:
+            import configparser
+            self._cfg = configparser.ConfigParser()
         config_file = ini_files[0]
-        config = configparser.ConfigParser()
-        config.read(config_file)
-        module_name = config.get('source', 'module', fallback=None)
+        self._cfg.clear()
+        self._cfg.read(config_file)
+        module_name = self._cfg.get('source', 'module', fallback=None)
         if not module_name:
             self.error_view.log_error(f"Invalid Config module specified in {config_file.name}")
             return
@@ -318,9 +371,15 @@ class MainWindow(QMainWindow):
     # ----------------- Validation / Widget -----------------
     def start_validation(self, source_path: Path):
         if self.validator_thread and self.validator_thread.isRunning():
-            self.validator_thread.stop()
-            self.validator_thread.wait()
+            # Don't block the GUI on wait(): cancel and start again once it finishes
+            if self._pending_validation is None:
+                self.validator_thread.cancel()
+                self.validator_thread.finished.connect(
+                    self._start_pending_validation, Qt.ConnectionType.SingleShotConnection)
+            self._pending_validation = source_path
+            return
 
+        self.evict_source_modules(source_path.parent)
         self.btn_select.setEnabled(False)
         self.btn_reload.setEnabled(False)
         self.lbl_status.setText("Validating source...")
@@ -333,6 +392,29 @@ class MainWindow(QMainWindow):
         self.validator_thread.finished.connect(self.on_validation_finished)
         self.validator_thread.start()
 
+    def evict_source_modules(self, folder: Path):
+        """
+        Drop every module loaded from `folder` so the module and its sibling
+        imports are executed again instead of served stale from sys.modules.
+        """
+        modules = sys.modules
+        prefix = os.path.normcase(os.path.abspath(folder)) + os.sep
+        stale = [
+            name for name, mod in modules.items()
+            if name != "__main__"
+            and getattr(mod, "__file__", None)
+            and os.path.normcase(os.path.abspath(mod.__file__)).startswith(prefix)
+        ]
+        for name in stale:
+            modules.pop(name, None)
+        # Newly created sibling files must not be hidden by stale finder caches
+        importlib.invalidate_caches()
+
+    def _start_pending_validation(self):
+        source_path, self._pending_validation = self._pending_validation, None
+        if source_path:
+            self.start_validation(source_path)
+
     @pyqtSlot(int, str)
     def on_progress_update(self, progress: int, message: str):
         self.progress_bar.setValue(progress)
@@ -347,11 +429,14 @@ class MainWindow(QMainWindow):
     def on_validation_complete(self, success: bool, message: str, module: Any):
         if success and module:
             self.current_module = module
-            self.instantiate_widget(module)
+            # The validator re-reads the config on every run, so an edited
+            # entry_point takes effect on auto-reload. Read from the sender:
+            # validator_thread may already be a newer run.
+            self.instantiate_widget(module, self.sender().entry_point)
             self.lbl_status.setText(f"<span style='color:#48bb78'>{message}</span>")
             self.btn_reload.setEnabled(True)
             if self.auto_reload_check.isChecked():
-                QTimer.singleShot(1000, self.enable_file_watching)
+                self._rewatch_timer.start()
         else:
             self.error_view.log_error(f"Load Failed {message}")
             self.lbl_status.setText("<span style='color:#f56565'>Load failed</span>")
@@ -361,8 +446,11 @@ class MainWindow(QMainWindow):
         self.btn_select.setEnabled(True)
         self.progress_bar.hide()
         self.ready_label.setText("Ready")
+        # A queued validation still belongs to the running reload
+        if self._pending_validation is None and self._reloading.locked():
+            self._reloading.release()
 
-    def instantiate_widget(self, module: Any):
+    def instantiate_widget(self, module: Any, entry_point: str = "main_widget"):
         """
         Safely instantiate the entry point widget from the module.
         Prevent crashes if the module has typos or missing classes.
@@ -372,11 +460,6 @@ class MainWindow(QMainWindow):
             return
 
         try:
-            import configparser
-            config_path = self.current_source.parent / f"{self.current_source.stem}.ini"
-            config = configparser.ConfigParser()
-            config.read(config_path)
-            entry_point = config.get('source', 'entry_point', fallback='main_widget')
             widget_factory = getattr(module, entry_point, None)
 
             if not widget_factory:
@@ -412,72 +495,90 @@ class MainWindow(QMainWindow):
             self.auto_reload_indicator.setText("⏰ OFF")
 
     def enable_file_watching(self):
-        if not self.current_source or self.is_reloading:
+        if not self.current_source or self._reloading.locked():
             return
 
-        self.file_watcher.blockSignals(True)
-
-        # Iterate over desired file extensions
+        # One recursive watch covers the module, its sub-packages and the config
+        folder = self.current_source.parent
+        if not folder.is_dir():
+            # Moved or deleted since it was loaded; os.walk would just list nothing
+            self.watch_folder_missing(folder)
+            return
         paths = []
-        for ext in ("*.py", "*.ini", "*.qss"):
-            paths.extend(str(p) for p in self.current_source.parent.rglob(ext))
+        for dirpath, dirnames, filenames in os.walk(folder):
+            # Caches, VCS data and virtualenvs never hold user sources
+            dirnames[:] = [d for d in dirnames if d != "__pycache__" and not d.startswith(".")]
+            paths.extend(os.path.join(dirpath, name) for name in filenames
+                         if name.endswith((".py", ".ini", ".qss")))
 
-        self.file_watcher.removePaths(self.file_watcher.files())
-        self.file_watcher.addPaths(paths)
-        self.file_watcher.blockSignals(False)
-
-        self.file_watcher.fileChanged.connect(self.on_file_changed)
-        self.watcher_status_label.setText(f"👁️ Watching {len(paths)} files")
-        self.watched_files_label.setText(f"Watching {len(paths)} file(s) for changes")
+        try:
+            self.file_watcher.watch(folder, paths)
+        except OSError as e:
+            self.error_view.log_error(f"Watch Failed Could not watch {folder}: {e}")
+            self.watch_folder_missing(folder)
+            return
+        if not self._fw_connected:
+            self.file_watcher.file_changed.connect(
+                self.on_file_changed, Qt.ConnectionType.QueuedConnection)
+            self._fw_connected = True
+        count = self.file_watcher.count()
+        self.watcher_status_label.setText(f"👁️ Watching {count} files")
+        self.watched_files_label.setText(f"Watching {count} file(s) for changes")
+
+    def watch_folder_missing(self, folder: Path):
+        self.file_watcher.stop()
+        self.watcher_status_label.setText("⚠️ Folder missing")
+        self.watched_files_label.setText(f"Folder missing: {folder}")
 
     def disable_file_watching(self):
-        try:
-            self.file_watcher.fileChanged.disconnect()
-        except Exception:
-            pass
-        self.file_watcher.removePaths(self.file_watcher.files())
+        if self._fw_connected:
+            self.file_watcher.file_changed.disconnect(self.on_file_changed)
+            self._fw_connected = False
+        self.file_watcher.stop()
         self.watcher_status_label.setText("🔒 No files watched")
         self.watched_files_label.setText("Watching 0 files")
 
     def on_file_changed(self, path: str):
-        if self.is_reloading or not self.auto_reload_check.isChecked():
+        if self._reloading.locked() or not self.auto_reload_check.isChecked():
             return
-        if not os.path.exists(path):
-            QTimer.singleShot(1000, lambda: self.reenable_file_watching(path))
+        # Trust the watcher; only drop duplicate notifications for the same save
+        now = time.monotonic()
+        if now - self._last_event_ts.get(path, 0.0) < 0.05:
             return
-        mtime = os.path.getmtime(path)
-        last = self.last_modification.get(path, 0)
-        if mtime > last + 0.1:
-            self.last_modification[path] = mtime
-            self.lbl_status.setText(f"<span style='color:#ed8936'>🔄 {os.path.basename(path)} changed</span>")
-            self.reload_timer.start()
-
-    def reenable_file_watching(self, path):
-        if os.path.exists(path) and self.auto_reload_check.isChecked():
-            try:
-                self.file_watcher.addPath(path)
-                self.last_modification[path] = os.path.getmtime(path)
-            except Exception:
-                pass
+        self._last_event_ts[path] = now
+        # Collect the burst, restarting the timer drains it once when it settles
+        self._pending_changes.add(path)
+        self.lbl_status.setText(f"<span style='color:#ed8936'>🔄 {os.path.basename(path)} changed</span>")
+        # Restarting alone would postpone the reload forever under autosave
+        if self._first_pending_change is None:
+            self._first_pending_change = now
+        elif now - self._first_pending_change > self.reload_max_wait:
+            self.reload_timer.stop()
+            self.debounced_reload()
+            return
+        self.reload_timer.start()
 
     def debounced_reload(self):
-        if self.current_source and not self.is_reloading:
-            self.is_reloading = True
+        changed = list(self._pending_changes)
+        self._pending_changes.clear()
+        self._first_pending_change = None
+        if not changed:
+            return
+
+        # Check-and-set in one step so a burst can't start two reload chains
+        if self.current_source and self._reloading.acquire(blocking=False):
             self.lbl_status.setText("<span style='color:#4299e1'>🔄 Auto-reloading source...</span>")
-            QTimer.singleShot(500, self.perform_auto_reload)
+            self._auto_reload_timer.start()
 
     def perform_auto_reload(self):
         try:
             self.renderer.begin_update()
             self.renderer.clear()
-            if self.current_source:
-                mod_name = self.current_source.stem
-                if mod_name in sys.modules:
-                    del sys.modules[mod_name]
             self.start_validation(self.current_source)
             self.renderer.end_update()
-        finally:
-            self.is_reloading = False
+        except Exception:
+            self._reloading.release()
+            raise
 
     def reload_source(self):
         if self.current_source:
@@ -491,8 +592,9 @@ class MainWindow(QMainWindow):
         self.renderer.toggle_detached()
 
     def reset_layout(self):
-        self.renderer.setVisible(True)
-        self.renderer.resetDockWidget()
+        # Reuse the existing dock; re-adding it only moves it back to its default area
+        self.renderer.reset_to_defaults()
+        self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self.renderer)
         self.showNormal()
 
     def toggle_theme(self):
@@ -502,13 +604,44 @@ class MainWindow(QMainWindow):
         now = QDateTime.currentDateTime()
         return now.toString("yyyy-MM-dd HH:mm:ss")
 
+    def update_memory_timer(self):
+        """Poll memory only while the window is shown, not minimized and active."""
+        if self.isVisible() and not self.isMinimized() and self.isActiveWindow():
+            if not self.memory_timer.isActive():
+                self.update_memory_usage()
+                self.memory_timer.start()
+        else:
+            self.memory_timer.stop()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.update_memory_timer()
+
+    def hideEvent(self, event):
+        self.memory_timer.stop()
+        super().hideEvent(event)
+
+    def changeEvent(self, event):
+        if event.type() in (QEvent.Type.WindowStateChange, QEvent.Type.ActivationChange):
+            self.update_memory_timer()
+        super().changeEvent(event)
+
     def closeEvent(self, event):
         self.settings.setValue("window/geometry", self.saveGeometry())
         self.settings.setValue("window/state", self.saveState())
+        # Both values are written together, flush once instead of on Qt's timer
+        self.settings.sync()
         self.disable_file_watching()
+        if self._statm is not None:
+            self._statm.close()
+            self._statm = None
+        self.reload_timer.stop()
+        self._auto_reload_timer.stop()
+        self._pending_validation = None  # nothing may start after the running one
         if self.validator_thread and self.validator_thread.isRunning():
-            self.validator_thread.stop()
-            self.validator_thread.wait()
+            # Cooperative stop at the next stage boundary; never terminate()
+            self.validator_thread.cancel()
+            self.validator_thread.wait(2000)
         super().closeEvent(event)
 
 
@@ -0,0 +1,135 @@
+import os
+import sys
+import json
+import time
+import marshal
+import hashlib
+from pathlib import Path
+from types import CodeType
+from typing import Optional
+
+MAX_CACHE_BYTES = 64 * 1024 * 1024   # oldest entries are evicted past this
+MAX_ENTRY_AGE = 30 * 24 * 60 * 60    # seconds since an entry was last used
+CACHE_SUFFIXES = (".json", ".code")  # anything else is a stale format or leftover temp file
+
+
+class AstCache:
+    """
+    On-disk cache of per-source analysis results, keyed by the SHA-256 of the
+    source bytes plus the interpreter version and optimization level. Content
+    keys never go stale, so there is no mtime bookkeeping; unchanged files skip
+    parsing and compiling. Entries unused for MAX_ENTRY_AGE, and the oldest
+    ones past MAX_CACHE_BYTES, are pruned once per process on the first write.
+
+    Like __pycache__, the directory is trusted: cached code objects are executed
+    as loaded, so anyone who can write to it can run code. It is created
+    private to the user (0o700).
+    """
+
+    def __init__(self, cache_dir: str | Path | None = None):
+        if cache_dir is None:
+            base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+            cache_dir = Path(base) / "qtforge" / "source-ast-cache"
+        self.cache_dir = Path(cache_dir)
+        self._pruned = False
+
+    @staticmethod
+    def key_for(content: bytes) -> str:
+        digest = hashlib.sha256(content)
+        digest.update(sys.version.encode())
+        # -O / -OO strip asserts and docstrings, like .opt-N.pyc
+        digest.update(f"opt-{sys.flags.optimize}".encode())
+        return digest.hexdigest()
+
+    # ----------------- Dependencies -----------------
+    def load_dependencies(self, key: str) -> Optional[set[str]]:
+        # Plain data, so JSON rather than pickle; the .code entries are the
+        # executable part of the cache (see the class docstring)
+        path = self.cache_dir / f"{key}.json"
+        try:
+            with open(path, "rb") as f:
+                names = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(names, list) or not all(isinstance(n, str) for n in names):
+            return None
+        self._touch(path)
+        return set(names)
+
+    def store_dependencies(self, key: str, dependencies: set[str]):
+        self._write(f"{key}.json", json.dumps(sorted(dependencies)).encode())
+
+    # ----------------- Code objects -----------------
+    def load_code(self, key: str) -> Optional[CodeType]:
+        path = self.cache_dir / f"{key}.code"
+        try:
+            with open(path, "rb") as f:
+                code = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if not isinstance(code, CodeType):
+            return None
+        self._touch(path)
+        return code
+
+    def store_code(self, key: str, code: CodeType):
+        self._write(f"{key}.code", marshal.dumps(code))
+
+    # ----------------- Eviction -----------------
+    def prune(self, max_bytes: int = MAX_CACHE_BYTES, max_age: float = MAX_ENTRY_AGE):
+        """Drop entries unused for `max_age` seconds, then the least recently used past `max_bytes`."""
+        cutoff = time.time() - max_age
+        entries = []
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    if not entry.name.endswith(CACHE_SUFFIXES):
+                        # Old pickle entries, or a temp file left by a crashed writer
+                        if entry.name.endswith(".pkl") or st.st_mtime < cutoff:
+                            self._remove(entry.path)
+                    elif st.st_mtime < cutoff:
+                        self._remove(entry.path)
+                    else:
+                        entries.append((st.st_mtime, st.st_size, entry.path))
+        except OSError:
+            return
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    # ----------------- Internal -----------------
+    @staticmethod
+    def _touch(path: Path):
+        """Mark an entry as used, eviction goes by mtime."""
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _write(self, name: str, data: bytes):
+        """Write atomically so a concurrent reader never sees a partial file."""
+        if not self._pruned:
+            self._pruned = True
+            self.prune()
+        try:
+            self.cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            tmp = self.cache_dir / f"{name}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, self.cache_dir / name)
+        except OSError as e:
+            print(f"[AstCache] Could not write {name}: {e}")
@@ -161,6 +161,15 @@ class DetachableRenderer(QDockWidget):
             self.setWindowTitle("Renderer - Detached")
         print("[DetachableRenderer] clear complete")
 
+    def reset_to_defaults(self):
+        """Re-dock and show the panel in place, keeping the hosted widget."""
+        print("[DetachableRenderer] reset_to_defaults called")
+        if self.isFloating():
+            self.setFloating(False)
+        self.detach_button.setText("⤢")
+        self.setWindowTitle("Renderer")
+        self.setVisible(True)
+
     def begin_update(self):
         """Disable user interaction during update."""
         print("[DetachableRenderer] begin_update called")
@@ -1,5 +1,5 @@
 from PyQt6.QtWidgets import QTextEdit
-from PyQt6.QtGui import QFont
+from PyQt6.QtGui import QFont, QFontDatabase
 from PyQt6.QtCore import Qt
 
 
@@ -9,6 +9,20 @@ class ErrorLogView(QTextEdit):
     Designed for HTML-formatted messages.
     """
 
+    _log_font: QFont | None = None  # resolved once per process
+
+    @classmethod
+    def log_font(cls) -> QFont:
+        """Consolas when installed, else the system fixed-width font."""
+        if cls._log_font is None:
+            if "Consolas" in QFontDatabase.families():
+                font = QFont("Consolas")
+            else:
+                font = QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont)
+            font.setPointSize(10)
+            cls._log_font = font
+        return cls._log_font
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
@@ -17,9 +31,7 @@ class ErrorLogView(QTextEdit):
         self.setUndoRedoEnabled(False)
         # self.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
 
-        font = QFont("Consolas")
-        font.setPointSize(10)
-        self.setFont(font)
+        self.setFont(self.log_font())
 
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
@@ -0,0 +1,215 @@
+import os
+import sys
+import ctypes
+import ctypes.util
+import struct
+from PyQt6.QtCore import QObject, QSocketNotifier, QFileSystemWatcher, QTimer, pyqtSignal
+
+# <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+
+# Events on a directory entry that change its listing
+DIR_EVENTS = IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO
+# Events that report a watched file as complete: the writer closed it or
+# renamed it into place, so a reader never sees a half-written file
+FILE_EVENTS = IN_CLOSE_WRITE | DIR_EVENTS
+WATCH_MASK = FILE_EVENTS | IN_MODIFY | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+# IN_MODIFY without a close (a writer keeping the file open, e.g. a log)
+# is reported after this long instead
+MODIFY_SETTLE_MS = 250
+
+_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len; followed by the name
+
+
+def _load_libc():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+_libc = _load_libc()
+
+
+class InotifyWatcher(QObject):
+    """
+    Drop-in for the QFileSystemWatcher API used here, on raw inotify read
+    through a QSocketNotifier: nothing runs until the kernel has an event.
+    Files are watched through their directory and matched by name, so an
+    editor's atomic rename never drops the watch.
+    """
+
+    fileChanged = pyqtSignal(str)
+    directoryChanged = pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        fd = _libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._fd = fd
+        self._dir_wds: dict[str, int] = {}
+        self._wd_dirs: dict[int, str] = {}
+        self._dirs: dict[str, str] = {}              # directory -> path as added
+        self._files: dict[str, dict[str, str]] = {}  # directory -> {name: path as added}
+        self._notifier = QSocketNotifier(fd, QSocketNotifier.Type.Read, self)
+        self._notifier.activated.connect(self._read_events)
+        self._modified: dict[str, None] = {}  # written to, not closed yet
+        self._settle = QTimer(self)
+        self._settle.setSingleShot(True)
+        self._settle.setInterval(MODIFY_SETTLE_MS)
+        self._settle.timeout.connect(self._flush_modified)
+
+    # ----------------- QFileSystemWatcher API -----------------
+    def addPath(self, path) -> bool:
+        path = str(path)
+        full = os.path.abspath(path)
+        if os.path.isdir(full):
+            directory, name = full, None
+        else:
+            directory, name = os.path.split(full)
+        if not self._watch_dir(directory):
+            return False
+        if name is None:
+            self._dirs[directory] = path
+        else:
+            self._files.setdefault(directory, {})[name] = path
+        return True
+
+    def addPaths(self, paths) -> list[str]:
+        return [str(p) for p in paths if not self.addPath(p)]
+
+    def removePath(self, path) -> bool:
+        full = os.path.abspath(str(path))
+        if self._dirs.pop(full, None) is not None:
+            directory = full
+        else:
+            directory, name = os.path.split(full)
+            names = self._files.get(directory)
+            if not names or names.pop(name, None) is None:
+                return False
+            if not names:
+                del self._files[directory]
+        self._unwatch_dir(directory)
+        return True
+
+    def removePaths(self, paths) -> list[str]:
+        return [str(p) for p in paths if not self.removePath(p)]
+
+    def files(self) -> list[str]:
+        return [path for names in self._files.values() for path in names.values()]
+
+    def directories(self) -> list[str]:
+        return list(self._dirs.values())
+
+    def close(self):
+        if self._fd >= 0:
+            self._notifier.setEnabled(False)
+            self._settle.stop()
+            os.close(self._fd)
+            self._fd = -1
+
+    # ----------------- Internal -----------------
+    def _watch_dir(self, directory: str) -> bool:
+        if directory in self._dir_wds:
+            return True
+        wd = _libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            return False
+        self._dir_wds[directory] = wd
+        self._wd_dirs[wd] = directory
+        return True
+
+    def _unwatch_dir(self, directory: str):
+        if directory in self._dirs or directory in self._files:
+            return
+        wd = self._dir_wds.pop(directory, None)
+        if wd is not None:
+            del self._wd_dirs[wd]
+            _libc.inotify_rm_watch(self._fd, wd)
+
+    def _read_events(self, *_):
+        try:
+            buf = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return
+
+        # Ordered sets: a burst for one file is reported once per read
+        changed_files: dict[str, None] = {}
+        changed_dirs: dict[str, None] = {}
+        pos = 0
+        while pos < len(buf):
+            wd, mask, _cookie, length = _EVENT.unpack_from(buf, pos)
+            pos += _EVENT.size
+            name = os.fsdecode(buf[pos:pos + length].rstrip(b"\0"))
+            pos += length
+
+            if mask & IN_Q_OVERFLOW:
+                # Events were lost, report everything so consumers re-check
+                for directory in self._dir_wds:
+                    changed_dirs[directory] = None
+                    changed_files.update(dict.fromkeys(self._files.get(directory, {}).values()))
+                continue
+            directory = self._wd_dirs.get(wd)
+            if directory is None:
+                continue
+            if mask & IN_IGNORED:
+                # Directory deleted or unmounted, the kernel dropped the watch
+                del self._wd_dirs[wd]
+                self._dir_wds.pop(directory, None)
+                changed_dirs[directory] = None
+                continue
+            if mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                changed_dirs[directory] = None
+                continue
+
+            path = self._files.get(directory, {}).get(name)
+            if path is not None:
+                if mask & FILE_EVENTS:
+                    changed_files[path] = None
+                    self._modified.pop(path, None)
+                elif mask & IN_MODIFY:
+                    self._modified[path] = None
+            if mask & DIR_EVENTS:
+                changed_dirs[directory] = None
+
+        # Not restarted by further writes, so a constantly written file still reports
+        if self._modified and not self._settle.isActive():
+            self._settle.start()
+        for path in changed_files:
+            self.fileChanged.emit(path)
+        for directory in changed_dirs:
+            # Like QFileSystemWatcher, only explicitly watched directories are reported
+            if directory in self._dirs:
+                self.directoryChanged.emit(self._dirs[directory])
+
+    def _flush_modified(self):
+        modified, self._modified = self._modified, {}
+        for path in modified:
+            self.fileChanged.emit(path)
+
+
+def create_fs_watcher(parent=None):
+    """InotifyWatcher on Linux, QFileSystemWatcher elsewhere or when inotify is unavailable."""
+    if _libc is not None:
+        try:
+            return InotifyWatcher(parent)
+        except OSError as e:
+            print(f"[InotifyWatcher] Falling back to QFileSystemWatcher: {e}")
+    return QFileSystemWatcher(parent)
@@ -0,0 +1,101 @@
+import os
+from typing import Callable, Optional
+from PyQt6.QtCore import QObject
+
+from libs.Inotifywatcher import create_fs_watcher
+
+
+class SharedFSWatcher(QObject):
+    """
+    One process-wide file system watcher with per-path callbacks, so every
+    consumer reloading on change shares the same kernel watches. Files are
+    watched together with their directory; a file dropped from the watch by
+    an atomic save is re-armed and reported as changed.
+    """
+
+    _instance: Optional["SharedFSWatcher"] = None
+
+    @classmethod
+    def instance(cls) -> "SharedFSWatcher":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        super().__init__()
+        self.watcher = create_fs_watcher(self)
+        self.watcher.fileChanged.connect(self._on_file_changed)
+        self.watcher.directoryChanged.connect(self._on_dir_changed)
+        self._callbacks: dict[str, list[Callable[[str], None]]] = {}
+        self._dir_refs: dict[str, int] = {}  # directory -> registrations needing it
+        self._dir_keys: set[str] = set()     # paths registered as directories
+
+    # ----------------- Registration -----------------
+    def register(self, path, callback: Callable[[str], None], owner: Optional[QObject] = None):
+        """
+        Call `callback(path)` from the GUI thread whenever `path` (a file or a
+        directory) changes. With `owner`, the callback is dropped when it is destroyed.
+        """
+        key = os.path.abspath(str(path))
+        callbacks = self._callbacks.setdefault(key, [])
+        if not callbacks:
+            if os.path.isdir(key):
+                self._dir_keys.add(key)
+                self._retain_dir(key)
+            else:
+                self._retain_dir(os.path.dirname(key))
+                if os.path.exists(key):
+                    self.watcher.addPath(key)
+        callbacks.append(callback)
+        if owner is not None:
+            owner.destroyed.connect(lambda *_: self.unregister(key, callback))
+
+    def unregister(self, path, callback: Callable[[str], None]):
+        key = os.path.abspath(str(path))
+        callbacks = self._callbacks.get(key)
+        if not callbacks or callback not in callbacks:
+            return
+        callbacks.remove(callback)
+        if callbacks:
+            return
+        del self._callbacks[key]
+        if key in self._dir_keys:
+            self._dir_keys.discard(key)
+            self._release_dir(key)
+        else:
+            if key in self.watcher.files():
+                self.watcher.removePath(key)
+            self._release_dir(os.path.dirname(key))
+
+    # ----------------- Internal -----------------
+    def _retain_dir(self, directory: str):
+        refs = self._dir_refs.get(directory, 0)
+        if refs == 0:
+            self.watcher.addPath(directory)
+        self._dir_refs[directory] = refs + 1
+
+    def _release_dir(self, directory: str):
+        refs = self._dir_refs.get(directory, 0) - 1
+        if refs > 0:
+            self._dir_refs[directory] = refs
+            return
+        self._dir_refs.pop(directory, None)
+        self.watcher.removePath(directory)
+
+    def _on_file_changed(self, path: str):
+        self._dispatch(os.path.abspath(path))
+
+    def _on_dir_changed(self, directory: str):
+        directory = os.path.abspath(directory)
+        armed = set(self.watcher.files())
+        for key in list(self._callbacks):
+            if (key not in self._dir_keys and key not in armed
+                    and os.path.dirname(key) == directory and os.path.exists(key)):
+                # Replaced on save or re-created: re-arm and report it
+                self.watcher.addPath(key)
+                self._dispatch(key)
+        self._dispatch(directory)
+
+    def _dispatch(self, key: str):
+        for callback in list(self._callbacks.get(key, ())):
+            callback(key)
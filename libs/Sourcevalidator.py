@@ -1,7 +1,9 @@
+import os
+import re
 import sys
 import ast
 import importlib.util
-import configparser
+import threading
 from pathlib import Path
 from PyQt6.QtCore import pyqtSignal, QThread
 import traceback
@@ -10,6 +12,25 @@ import io
 from pyflakes.api import check
 from pyflakes.reporter import Reporter
 
+from libs.Astcache import AstCache
+
+# path -> (st_mtime_ns, st_size, dependency names), shared across validator runs
+_dependency_cache: dict[str, tuple[int, int, frozenset[str]]] = {}
+# folder -> (st_mtime_ns, stems of the .py files in it); adding/removing a file bumps the mtime
+_local_modules_cache: dict[str, tuple[int, frozenset[str]]] = {}
+# Import statements at the start of a line, scanned without building an AST
+_IMPORT_RE = re.compile(
+    r"^[ \t]*(?:from[ \t]+([\w.]+)[ \t]+import|import[ \t]+([\w.,\t ]+))", re.MULTILINE
+)
+# Triple-quoted blocks are dropped first so docstring text is never matched
+_TRIPLE_QUOTED_RE = re.compile(r"(\"\"\"|''').*?\1", re.DOTALL)
+# Every stdlib module name (3.10+); these never resolve to a sibling file
+_BUILTIN_MODULES = frozenset(sys.stdlib_module_names) | frozenset(sys.builtin_module_names)
+# `key = value` / `key: value` lines of the source .ini
+_INI_KEY_RE = re.compile(r"([^=:]+?)\s*[=:]\s*(.*)")
+# Content-hash keyed results that survive restarts
+_ast_cache = AstCache()
+
 class SourceValidator(QThread):
     """Background thread for source validation and safe module loading."""
 
@@ -21,35 +42,131 @@ class SourceValidator(QThread):
         super().__init__()
         self.source_path = source_path
         self.config_path = source_path.parent / f"{source_path.stem}.ini"
+        self._cancel = threading.Event()
+        self.code = None  # compiled module code from the syntax check
+        self.entry_point = "main_widget"  # from the config read by this run
+
+    # ----------------- Cancellation -----------------
+    def cancel(self):
+        """Ask the running validation to stop at the next stage boundary."""
+        self._cancel.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancel.is_set()
 
     # ----------------- Dependency / Syntax -----------------
-    def find_dependencies(self, module_path: Path):
+    def find_dependencies(self, module_path: Path, source_bytes: bytes | None = None):
+        try:
+            st = os.stat(module_path)
+        except OSError as e:
+            print(f"[Validator] Dependency parse error: {e}")
+            return set()
+        cached = _dependency_cache.get(str(module_path))
+        if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return set(cached[2])
+
         dependencies = set()
         try:
-            content = module_path.read_text(encoding="utf-8")
-            tree = ast.parse(content)
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        dependencies.add(alias.name.split('.')[0])
-                elif isinstance(node, ast.ImportFrom) and node.module:
-                    dependencies.add(node.module.split('.')[0])
-        except Exception as e:
+            content = source_bytes if source_bytes is not None else module_path.read_bytes()
+            key = _ast_cache.key_for(content)
+            dependencies = _ast_cache.load_dependencies(key)
+            if dependencies is None:
+                try:
+                    dependencies = self.scan_imports(content.decode("utf-8"))
+                except UnicodeDecodeError:
+                    dependencies = self.scan_imports_ast(content)
+                _ast_cache.store_dependencies(key, dependencies)
+        except (OSError, SyntaxError, ValueError) as e:
             print(f"[Validator] Dependency parse error: {e}")
+            return set()
+        _dependency_cache[str(module_path)] = (st.st_mtime_ns, st.st_size, frozenset(dependencies))
+        return dependencies
+
+    def compile_source(self, module_path: Path, source_bytes: bytes | None = None):
+        """Compile the module, reusing the cached code object for unchanged content."""
+        content = source_bytes if source_bytes is not None else module_path.read_bytes()
+        key = _ast_cache.key_for(content + str(module_path).encode())
+        code = _ast_cache.load_code(key)
+        if code is None:
+            code = compile(content, str(module_path), "exec")
+            _ast_cache.store_code(key, code)
+        return code
+
+    @staticmethod
+    def scan_imports(source: str) -> set[str]:
+        """Collect imported top-level names with one regex pass over the text."""
+        dependencies = set()
+        for match in _IMPORT_RE.finditer(_TRIPLE_QUOTED_RE.sub("", source)):
+            if match.group(1):
+                # `from .pkg import x` keeps 'pkg', like ImportFrom.module
+                names = [match.group(1).lstrip(".")]
+            else:
+                names = match.group(2).split(",")
+            for part in names:
+                name = part.strip().split(" as ")[0].split(".")[0].strip()
+                if name:
+                    dependencies.add(name)
         return dependencies
 
+    @staticmethod
+    def scan_imports_ast(source: bytes) -> set[str]:
+        """Fallback scan over module-level Import / ImportFrom nodes."""
+        dependencies = set()
+        # ast.parse takes bytes and honours the coding cookie itself
+        for node in ast.parse(source).body:
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    dependencies.add(alias.name.split('.')[0])
+            elif isinstance(node, ast.ImportFrom) and node.module:
+                dependencies.add(node.module.split('.')[0])
+        return dependencies
+
+    @staticmethod
+    def local_modules(folder: Path) -> frozenset[str]:
+        """Stems of the .py files in `folder`, rescanned only when the directory changes."""
+        key = str(folder)
+        mtime_ns = os.stat(key).st_mtime_ns
+        cached = _local_modules_cache.get(key)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+        with os.scandir(key) as entries:
+            stems = frozenset(e.name[:-3] for e in entries if e.name.endswith(".py") and e.is_file())
+        _local_modules_cache[key] = (mtime_ns, stems)
+        return stems
+
     def is_builtin_module(self, module_name: str) -> bool:
-        return module_name in sys.builtin_module_names
+        return module_name in _BUILTIN_MODULES
+
+    # ----------------- Config -----------------
+    @staticmethod
+    def parse_config(text: str) -> dict[str, dict[str, str]]:
+        """Minimal INI reader for the source config: sections of key/value pairs."""
+        sections: dict[str, dict[str, str]] = {}
+        current = None
+        for line in text.splitlines():
+            line = line.strip()
+            if not line or line[0] in "#;":
+                continue
+            if line[0] == "[" and line[-1] == "]":
+                current = sections.setdefault(line[1:-1].strip(), {})
+                continue
+            match = _INI_KEY_RE.match(line)
+            if current is not None and match:
+                # Keys are case-insensitive, as with configparser
+                current[match.group(1).lower()] = match.group(2)
+        return sections
 
     # ----------------- Static Analysis -----------------
-    def run_pyflakes_check(self, module_path: Path) -> tuple[bool, str]:
+    def run_pyflakes_check(self, module_path: Path, source_bytes: bytes | None = None) -> tuple[bool, str]:
         """Run pyflakes and ignore unused import warnings."""
         try:
             stdout = io.StringIO()
             stderr = io.StringIO()
             reporter = Reporter(stdout, stderr)
 
-            source = module_path.read_text(encoding="utf-8")
+            if source_bytes is None:
+                source_bytes = module_path.read_bytes()
+            source = source_bytes.decode("utf-8")
             check(source, str(module_path), reporter)
 
             output = stdout.getvalue().strip()
@@ -75,22 +192,23 @@ class SourceValidator(QThread):
             self.progress_update.emit(10, "Starting validation...")
 
             # --- Config ---
+            if self.is_cancelled():
+                return
             if not self.config_path.exists():
                 self.preflight_check.emit(False, f"Missing config: {self.config_path.name}")
                 self.validation_complete.emit(False, "Config file missing", None)
                 return
 
             self.progress_update.emit(20, "Reading config...")
-            config = configparser.ConfigParser()
-            config.read(self.config_path)
+            config = self.parse_config(self.config_path.read_text(encoding="utf-8"))
 
             if "source" not in config:
                 self.preflight_check.emit(False, "Missing [source] section")
                 self.validation_complete.emit(False, "Invalid config", None)
                 return
 
-            module_name = config.get("source", "module", fallback=None)
-            entry_point = config.get("source", "entry_point", fallback="main_widget")
+            module_name = config["source"].get("module")
+            entry_point = self.entry_point = config["source"].get("entry_point", "main_widget")
 
             if not module_name:
                 self.preflight_check.emit(False, "Module not specified")
@@ -107,9 +225,13 @@ class SourceValidator(QThread):
                 return
 
             # --- Syntax ---
+            if self.is_cancelled():
+                return
             self.progress_update.emit(40, "Checking syntax...")
+            # Read once; compile, pyflakes and the dependency scan share the buffer
+            source_bytes = module_path.read_bytes()
             try:
-                compile(module_path.read_text(encoding="utf-8"), str(module_path), "exec")
+                self.code = self.compile_source(module_path, source_bytes)
                 self.preflight_check.emit(True, "Syntax OK")
             except SyntaxError as e:
                 msg = self.format_exception(e, module_path)
@@ -118,29 +240,38 @@ class SourceValidator(QThread):
                 return
 
             # --- Static Analysis ---
+            if self.is_cancelled():
+                return
             self.progress_update.emit(45, "Running static analysis...")
-            ok, msg = self.run_pyflakes_check(module_path)
+            ok, msg = self.run_pyflakes_check(module_path, source_bytes)
             if not ok:
                 self.preflight_check.emit(False, msg)
                 self.validation_complete.emit(False, f"Static analysis failed:\n{msg}", None)
                 return
 
             # --- Dependencies ---
+            if self.is_cancelled():
+                return
             self.progress_update.emit(55, "Analyzing dependencies...")
-            for dep in self.find_dependencies(module_path):
-                dep_file = self.source_path.parent / f"{dep}.py"
-                if dep_file.exists():
+            local_modules = self.local_modules(self.source_path.parent)
+            for dep in sorted(self.find_dependencies(module_path, source_bytes) & local_modules):
+                if dep not in _BUILTIN_MODULES:
                     self.progress_update.emit(60, f"Found dependency: {dep}")
 
             # --- Import ---
+            if self.is_cancelled():
+                return
             self.progress_update.emit(70, "Importing module...")
             module = None
             try:
+                # Always a fresh module: the hosted widget keeps running on the
+                # old one until the GUI thread swaps it out
                 spec = importlib.util.spec_from_file_location(module_name, module_path)
                 module = importlib.util.module_from_spec(spec)
                 sys.modules[module_name] = module
                 try:
-                    spec.loader.exec_module(module)
+                    # Run the code object from the syntax check; the loader would compile again
+                    exec(self.code, module.__dict__)
                 except ModuleNotFoundError as mnfe:
                     print(f"[Validator] Optional module not found: {mnfe.name}, ignoring.")
                 except Exception as e:
@@ -155,6 +286,8 @@ class SourceValidator(QThread):
                 return
 
             # --- Entry point ---
+            if self.is_cancelled():
+                return
             self.progress_update.emit(85, "Checking entry point...")
             if not hasattr(module, entry_point):
                 self.preflight_check.emit(False, f"Entry point '{entry_point}' not found")
@@ -162,6 +295,8 @@ class SourceValidator(QThread):
                 return
 
             # --- SUCCESS ---
+            if self.is_cancelled():
+                return
             self.progress_update.emit(100, "Validation complete")
             self.preflight_check.emit(True, "All checks passed")
             self.validation_complete.emit(True, "Source loaded successfully", module)
@@ -0,0 +1,183 @@
+import os
+from pathlib import Path
+from typing import Optional
+from PyQt6.QtCore import QObject, QFileSystemWatcher, pyqtSignal
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.observers.polling import PollingObserver
+    from watchdog.events import FileSystemEventHandler
+except ImportError:  # watchdog is optional, QFileSystemWatcher is used instead
+    Observer = None
+    PollingObserver = None
+    FileSystemEventHandler = object
+
+# Filesystems where native change notifications are unreliable or missing
+NETWORK_FS_TYPES = frozenset({
+    "nfs", "nfs4", "cifs", "smbfs", "smb2", "smb3",
+    "fuse.sshfs", "sshfs", "9p", "afpfs", "davfs", "webdav",
+})
+
+
+def is_network_path(folder: Path) -> bool:
+    """Best-effort check whether `folder` lives on a network mount."""
+    try:
+        import psutil
+        partitions = psutil.disk_partitions(all=True)
+    except Exception:
+        return False
+
+    target = os.path.normcase(os.path.realpath(folder))
+    best = None
+    for part in partitions:
+        mount = os.path.normcase(part.mountpoint)
+        if target == mount or target.startswith(mount.rstrip(os.sep) + os.sep):
+            if best is None or len(part.mountpoint) > len(best.mountpoint):
+                best = part
+    if best is None:
+        return False
+    return best.fstype.lower() in NETWORK_FS_TYPES or "remote" in best.opts.split(",")
+
+
+class _SourceEventHandler(FileSystemEventHandler):
+    """Forwards watchdog events from the observer thread to a SourceWatcher."""
+
+    def __init__(self, watcher: "SourceWatcher"):
+        super().__init__()
+        self.watcher = watcher
+
+    def on_modified(self, event):
+        if not event.is_directory:
+            self.watcher.notify(event.src_path)
+
+    on_created = on_modified
+
+    def on_moved(self, event):
+        # Atomic saves write a temp file and rename it over the original
+        if not event.is_directory:
+            self.watcher.notify(event.dest_path)
+
+
+class SourceWatcher(QObject):
+    """
+    Watches a source folder and its subfolders with one recursive watch and
+    reports changes to the tracked files. Uses watchdog (inotify / FSEvents /
+    ReadDirectoryChangesW) when installed, a polling observer on network
+    mounts, and QFileSystemWatcher otherwise.
+    """
+
+    file_changed = pyqtSignal(str)  # path of the changed file
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.folder: Optional[Path] = None
+        self.observer = None
+        self.fallback: Optional[QFileSystemWatcher] = None
+        self.watched_files: frozenset[str] = frozenset()
+        self._paths: frozenset[str] = frozenset()  # fallback only: files as given
+        self._dirs: list[str] = []                 # fallback only: folders holding them
+        self._mtimes: dict[str, int] = {}          # fallback only: path -> st_mtime_ns
+
+    # ----------------- Control -----------------
+    def watch(self, folder: Path, files: list[str]):
+        """Start watching `files` inside `folder` or its subfolders, replacing any previous watch."""
+        self.stop()
+        self.folder = folder
+        # Symlinked paths to the same file collapse into one watch
+        unique: dict[str, str] = {}
+        for f in files:
+            unique.setdefault(self._key(f), f)
+        self.watched_files = frozenset(unique)
+        files = list(unique.values())
+        # Writes to a symlink's target are only reported in the target's own
+        # folder, so folders outside the watched tree are watched as well
+        root = self._key(str(folder)).rstrip(os.sep) + os.sep
+        targets = [os.path.realpath(f) for f in files if os.path.islink(f)]
+        link_dirs = sorted({os.path.dirname(t) for t in targets
+                            if not self._key(t).startswith(root)})
+
+        if Observer is None:
+            # The directory watches catch files replaced on save; Qt's directory
+            # watch does not report in-place writes, so files stay watched too.
+            # Qt has no recursive watch, so every folder holding a file is added.
+            self.fallback = QFileSystemWatcher(self)
+            self.fallback.fileChanged.connect(self._on_fallback_changed)
+            self.fallback.directoryChanged.connect(self._on_fallback_dir_changed)
+            self._paths = frozenset(files) | frozenset(targets)
+            self._dirs = sorted({str(folder)} | {os.path.dirname(f) for f in files} | set(link_dirs))
+            self.fallback.addPaths(self._dirs + files)
+            self._mtimes = self._snapshot()
+            return
+
+        if is_network_path(folder):
+            self.observer = PollingObserver(timeout=30)
+        else:
+            self.observer = Observer()
+        self.observer.daemon = True
+        handler = _SourceEventHandler(self)
+        self.observer.schedule(handler, str(folder), recursive=True)
+        for directory in link_dirs:
+            self.observer.schedule(handler, directory, recursive=False)
+        self.observer.start()
+
+    def stop(self):
+        if self.observer is not None:
+            self.observer.unschedule_all()
+            self.observer.stop()
+            self.observer = None
+        if self.fallback is not None:
+            self.fallback.removePaths(self.fallback.files() + self.fallback.directories())
+            self.fallback.deleteLater()
+            self.fallback = None
+        self.watched_files = frozenset()
+        self._paths = frozenset()
+        self._dirs = []
+        self._mtimes = {}
+
+    def count(self) -> int:
+        return len(self.watched_files)
+
+    # ----------------- Events -----------------
+    def notify(self, path: str):
+        """Called from the observer thread; the signal is queued to the GUI thread."""
+        if self._key(path) in self.watched_files:
+            self.file_changed.emit(path)
+
+    def _on_fallback_changed(self, path: str):
+        try:
+            self._mtimes[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            return  # replaced on save, the directory event re-arms it
+        self.file_changed.emit(path)
+
+    def _on_fallback_dir_changed(self, _directory: str):
+        current = self._snapshot()
+        armed = set(self.fallback.files())
+        # Files replaced on save were dropped by the watcher, re-add them in one call
+        dropped = [path for path in current if path not in armed]
+        if dropped:
+            self.fallback.addPaths(dropped)
+        for path, mtime in current.items():
+            if self._mtimes.get(path) != mtime:
+                self.file_changed.emit(path)
+        self._mtimes = current
+
+    def _snapshot(self) -> dict[str, int]:
+        """st_mtime_ns of the watched files from one scandir per watched folder."""
+        mtimes = {}
+        for directory in self._dirs:
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.path in self._paths:
+                            try:
+                                mtimes[entry.path] = entry.stat().st_mtime_ns
+                            except OSError:
+                                pass
+            except OSError:
+                continue  # folder removed, its files simply drop out
+        return mtimes
+
+    @staticmethod
+    def _key(path: str) -> str:
+        return os.path.normcase(os.path.realpath(path))
@@ -1,11 +1,50 @@
 # libs/stylesheetModefier.py
+import os
+import re
+import hashlib
 from PyQt6.QtWidgets import QWidget
 from pathlib import Path
 
+from libs.Sharedwatcher import SharedFSWatcher
+
+_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_SPACE_RE = re.compile(r"\s+")
+
+
 class StylesheetModifier:
-    def __init__(self, qss_path: str | Path, parent: QWidget):
+    # path -> ((st_size, st_mtime_ns), minified qss, digest), shared by every window in the process
+    _cache: dict[str, tuple[tuple[int, int], str, bytes]] = {}
+
+    def __init__(self, qss_path: str | Path, parent: QWidget, live_reload: bool = True):
         self.qss_path = Path(qss_path)
         self.parent = parent
+        self._applied_digest: bytes | None = None  # digest of the QSS set on parent
+        if live_reload:
+            # Re-apply on save through the process-wide watcher, no polling
+            SharedFSWatcher.instance().register(self.qss_path, self._on_qss_changed, owner=parent)
+
+    def _on_qss_changed(self, _path: str):
+        self.apply_stylesheet()
+
+    def load_stylesheet(self) -> str:
+        """Return the QSS with comments and extra whitespace stripped, read once per change."""
+        return self._load()[0]
+
+    def _load(self) -> tuple[str, bytes]:
+        key = str(self.qss_path.resolve())
+        # Size too: two saves within the mtime granularity share an mtime
+        st = os.stat(key)
+        ident = (st.st_size, st.st_mtime_ns)
+        cached = self._cache.get(key)
+        if cached and cached[0] == ident:
+            return cached[1], cached[2]
+
+        with open(key, 'r', encoding='utf-8') as f:
+            qss_content = f.read()
+        qss_content = _SPACE_RE.sub(" ", _COMMENT_RE.sub("", qss_content)).strip()
+        digest = hashlib.blake2b(qss_content.encode(), digest_size=16).digest()
+        self._cache[key] = (ident, qss_content, digest)
+        return qss_content, digest
 
     def apply_stylesheet(self):
         """Load and apply the QSS stylesheet to the parent widget."""
@@ -13,12 +52,16 @@ class StylesheetModifier:
             print(f"[StylesheetModifier] QSS file not found: {self.qss_path}")
             return
         try:
-            with open(self.qss_path, 'r', encoding='utf-8') as f:
-                qss_content = f.read()
-                self.parent.setStyleSheet(qss_content)
-                print(f"[StylesheetModifier] Stylesheet applied: {self.qss_path.name}")
+            qss_content, digest = self._load()
+            # Same rules as already applied (touch, or a comment-only edit):
+            # skip Qt's re-parse and the re-polish of every child widget
+            if digest == self._applied_digest:
+                return
+            self.parent.setStyleSheet(qss_content)
+            self._applied_digest = digest
+            print(f"[StylesheetModifier] Stylesheet applied: {self.qss_path.name}")
         except Exception as e:
             print(f"[StylesheetModifier] Failed to apply stylesheet: {e}")
 
     def toggle_theme(self):
-        pass
\ No newline at end of file
+        pass
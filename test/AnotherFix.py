@@ -1,6 +1,18 @@
 import re
 from pathlib import Path
 
+# QWidget / QMainWindow subclass header plus its body (blank or deeper-indented lines)
+_CLASS_RE = re.compile(
+    r"^([ \t]*)class\s+\w+\s*\(\s*(?:QWidget|QMainWindow)\s*\)\s*:.*\n((?:[ \t]*\n|\1[ \t]+.*\n?)*)",
+    re.MULTILINE,
+)
+# `def __init__(...):` line plus its body; leading blank lines are skipped for the indent
+_INIT_RE = re.compile(
+    r"^([ \t]*)def\s+__init__\s*\(.*\):.*\n(?:[ \t]*\n)*((?:\1[ \t]+.*\n?|[ \t]*\n)*)",
+    re.MULTILINE,
+)
+_INDENT_RE = re.compile(r"[ \t]*")
+
 def fix_pyqt_init(file_path: str):
     """
     Fix all classes inheriting from QWidget or QMainWindow in a Python file.
@@ -12,57 +24,29 @@ def fix_pyqt_init(file_path: str):
         return
 
     with open(file_path, "r", encoding="utf-8") as f:
-        lines = f.readlines()
-
-    fixed_lines = []
-    inside_class = False
-    inside_init = False
-    init_indent = None
-    super_called = False
-    class_inherits = False
-
-    class_pattern = re.compile(r"class\s+\w+\s*\(\s*(QWidget|QMainWindow)\s*\)\s*:")
-    init_pattern = re.compile(r"def\s+__init__\s*\(.*\):")
-
-    for i, line in enumerate(lines):
-        stripped = line.strip()
-
-        # Detect class inheritance
-        if class_pattern.match(stripped):
-            inside_class = True
-            class_inherits = True
-            fixed_lines.append(line)
-            continue
-
-        # Detect __init__ method
-        if inside_class and init_pattern.match(stripped):
-            inside_init = True
-            init_indent = len(line) - len(line.lstrip())
-            super_called = False
-            fixed_lines.append(line)
-            continue
-
-        if inside_init:
-            current_indent = len(line) - len(line.lstrip())
-            # Detect end of __init__ by indentation
-            if stripped and current_indent <= init_indent:
-                if not super_called:
-                    fixed_lines.append(" " * (init_indent + 4) + "super().__init__()\n")
-                inside_init = False
-
-            # Check if super() already called
-            if "super().__init__" in stripped:
-                super_called = True
-
-        fixed_lines.append(line)
-
-    # If file ends while still inside __init__ and super not called
-    if inside_init and not super_called:
-        fixed_lines.append(" " * (init_indent + 4) + "super().__init__()\n")
+        content = f.read()
+
+    # (position, text) insertions from one regex walk, spliced in with a single join
+    insertions = []
+    for cls in _CLASS_RE.finditer(content):
+        for init in _INIT_RE.finditer(content, cls.start(2), cls.end(2)):
+            body = init.group(2)
+            if "super().__init__" in body:
+                continue
+            body_indent = _INDENT_RE.match(body).group(0) if body.strip() else init.group(1) + "    "
+            insertions.append((init.start(2), body_indent + "super().__init__()\n"))
+
+    parts = []
+    last = 0
+    for pos, text in insertions:
+        parts.append(content[last:pos])
+        parts.append(text)
+        last = pos
+    parts.append(content[last:])
 
     # Write back fixed file
     with open(file_path, "w", encoding="utf-8") as f:
-        f.writelines(fixed_lines)
+        f.write("".join(parts))
 
     print(f"[INFO] Fixed all PyQt __init__ inheritance in {file_path}")
 
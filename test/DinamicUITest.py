@@ -1,5 +1,6 @@
 import sys
 import random
+from collections import deque
 from PyQt6.QtWidgets import *
 from PyQt6.QtCore import *
 from PyQt6.QtGui import *
@@ -24,8 +25,8 @@ class DynamicTestUI(QWidget):
         self.widget_timer.timeout.connect(self.add_random_widget)
         self.widget_timer.start(500)  # add widget every 0.5 seconds
 
-        # Keep track of widgets
-        self.widgets = []
+        # Keep track of widgets; the deque drops the oldest once full
+        self.widgets = deque(maxlen=50)
 
     def add_random_widget(self):
         # Randomly choose widget type
@@ -34,7 +35,7 @@ class DynamicTestUI(QWidget):
 
         if widget_type == 'button':
             widget = QPushButton(f"Button {len(self.widgets)+1}")
-            widget.clicked.connect(lambda _, w=widget: print(f"{w.text()} clicked"))
+            widget.clicked.connect(self._on_clicked)
 
         elif widget_type == 'label':
             widget = QLabel(f"Label {len(self.widgets)+1}")
@@ -43,36 +44,60 @@ class DynamicTestUI(QWidget):
         elif widget_type == 'lineedit':
             widget = QLineEdit()
             widget.setPlaceholderText(f"LineEdit {len(self.widgets)+1}")
-            widget.textChanged.connect(lambda text, w=widget: print(f"{w.placeholderText()} text: {text}"))
+            widget.textChanged.connect(self._on_line_text_changed)
 
         elif widget_type == 'checkbox':
             widget = QCheckBox(f"CheckBox {len(self.widgets)+1}")
-            widget.stateChanged.connect(lambda state, w=widget: print(f"{w.text()} state: {state}"))
+            widget.stateChanged.connect(self._on_state_changed)
 
         elif widget_type == 'radiobutton':
             widget = QRadioButton(f"Radio {len(self.widgets)+1}")
-            widget.toggled.connect(lambda checked, w=widget: print(f"{w.text()} toggled: {checked}"))
+            widget.toggled.connect(self._on_toggled)
 
         elif widget_type == 'combobox':
             widget = QComboBox()
             items = [f"Item {i}" for i in range(1, 6)]
             widget.addItems(items)
-            widget.currentIndexChanged.connect(lambda idx, w=widget: print(f"{w.currentText()} selected"))
+            widget.currentIndexChanged.connect(self._on_index_changed)
 
         elif widget_type == 'textedit':
             widget = QTextEdit()
             widget.setPlaceholderText(f"TextEdit {len(self.widgets)+1}")
-            widget.textChanged.connect(lambda w=widget: print(f"{w.placeholderText()} changed"))
+            widget.textChanged.connect(self._on_text_edit_changed)
 
         if widget:
+            # Remove the widget the append is about to evict to avoid overload
+            if len(self.widgets) == self.widgets.maxlen:
+                old_widget = self.widgets[0]
+                self.layout.removeWidget(old_widget)
+                old_widget.deleteLater()
             self.layout.addWidget(widget)
             self.widgets.append(widget)
 
-        # Optional: remove old widgets to avoid overload
-        if len(self.widgets) > 50:
-            old_widget = self.widgets.pop(0)
-            self.layout.removeWidget(old_widget)
-            old_widget.deleteLater()
+    # Shared slots: the emitting widget comes from sender(), no closure per widget
+    @pyqtSlot()
+    def _on_clicked(self):
+        print(f"{self.sender().text()} clicked")
+
+    @pyqtSlot(str)
+    def _on_line_text_changed(self, text):
+        print(f"{self.sender().placeholderText()} text: {text}")
+
+    @pyqtSlot(int)
+    def _on_state_changed(self, state):
+        print(f"{self.sender().text()} state: {state}")
+
+    @pyqtSlot(bool)
+    def _on_toggled(self, checked):
+        print(f"{self.sender().text()} toggled: {checked}")
+
+    @pyqtSlot(int)
+    def _on_index_changed(self, _index):
+        print(f"{self.sender().currentText()} selected")
+
+    @pyqtSlot()
+    def _on_text_edit_changed(self):
+        print(f"{self.sender().placeholderText()} changed")
 
 
 if __name__ == "__main__":
@@ -1,6 +1,16 @@
 import re
 import os
 
+# `def __init__(...):` line plus its body (blank lines or deeper-indented lines)
+_INIT_RE = re.compile(
+    r"^([ \t]*)def[ \t]+__init__[ \t]*\(.*\)[ \t]*:[ \t]*\n((?:[ \t]*\n|\1[ \t]+.*\n?)*)",
+    re.MULTILINE,
+)
+# Stray `super()` lines that are not the __init__ call
+_BARE_SUPER_RE = re.compile(r"^[ \t]*super\(\)(?!.*\.__init__).*\n?", re.MULTILINE)
+_LEADING_BLANK_RE = re.compile(r"\A(?:[ \t]*\n)+")
+_INDENT_RE = re.compile(r"[ \t]*")
+
 def fix_init_super(file_path: str):
     """
     Ensure that each __init__ method has exactly one super().__init__() directly after the def line.
@@ -11,52 +21,25 @@ def fix_init_super(file_path: str):
         return
 
     with open(file_path, "r", encoding="utf-8") as f:
-        lines = f.readlines()
-
-    fixed_lines = []
-    inside_init = False
-    init_indent = None
-    super_added = False
-
-    for i, line in enumerate(lines):
-        stripped = line.strip()
-
-        # Detect __init__
-        if re.match(r"def __init__\s*\(.*\)\s*:", stripped):
-            inside_init = True
-            init_indent = len(line) - len(line.lstrip())
-            super_added = False
-            fixed_lines.append(line.rstrip() + "\n")
-            continue
-
-        if inside_init:
-            current_indent = len(line) - len(line.lstrip())
-
-            # Skip empty lines immediately after def
-            if not super_added and stripped == "":
-                continue
-
-            # Insert super if not added yet
-            if not super_added:
-                fixed_lines.append(" " * (init_indent + 4) + "super().__init__()\n")
-                super_added = True
-
-            # Remove extra super() lines
-            if stripped.startswith("super()") and ".__init__" not in stripped:
-                continue
-
-            # Detect end of __init__
-            if stripped and current_indent <= init_indent:
-                inside_init = False
-
-        fixed_lines.append(line)
-
-    # Ensure super added at EOF if inside __init__
-    if inside_init and not super_added:
-        fixed_lines.append(" " * (init_indent + 4) + "super().__init__()\n")
+        content = f.read()
+
+    # One regex walk over the file; edits are collected and joined at the end
+    parts = []
+    last = 0
+    for m in _INIT_RE.finditer(content):
+        indent, body = m.group(1), m.group(2)
+        body = _BARE_SUPER_RE.sub("", _LEADING_BLANK_RE.sub("", body))
+        body_indent = _INDENT_RE.match(body).group(0) if body.strip() else indent + "    "
+        parts.append(content[last:m.start(2)])
+        if "super().__init__" not in body:
+            parts.append(body_indent + "super().__init__()\n")
+        parts.append(body)
+        last = m.end()
+    parts.append(content[last:])
+    fixed = "".join(parts)
 
     with open(file_path, "w", encoding="utf-8") as f:
-        f.writelines(fixed_lines)
+        f.write(fixed)
 
     print(f"[INFO] Fixed __init__ in {file_path}")
 
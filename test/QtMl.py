@@ -7,12 +7,18 @@ from PyQt6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, QPu
 from PyQt6.QtWebEngineWidgets import QWebEngineView
 from PyQt6.QtWebChannel import QWebChannel
 
+# Points sent to the page per WebChannel message
+BATCH_SIZE = 8
+BATCH_FLUSH_MS = 500
+
 # ---------------------------
-# Bridge: JS -> Python calls
+# Bridge: JS <-> Python calls
 # ---------------------------
 class Bridge(QObject):
     # signal emitted when JS sends a message
     jsToPy = pyqtSignal(str)
+    # signal the page connects to: bridge.pyToJs.connect(window.handlePythonMessage)
+    pyToJs = pyqtSignal(str)
 
     @pyqtSlot(str)
     def sendToPy(self, msg: str):
@@ -61,6 +67,13 @@ class MainWindow(QMainWindow):
         # Load HTML (Chart.js from CDN + qwebchannel)
         self.view.setHtml(self._html(), QUrl("http://local/"))  # base URL helps resolving relative resources if needed
 
+        # Points are pushed in batches: one WebChannel message instead of one runJavaScript each
+        self._pending_points = []
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(BATCH_FLUSH_MS)
+        self.flush_timer.timeout.connect(self.flush_points)
+
         # Example: live update every 2s
         self.timer = QTimer(self)
         self.timer.setInterval(2000)
@@ -81,23 +94,31 @@ class MainWindow(QMainWindow):
             self._labels = []
         self._labels.append(label)
 
-        data = {
-            "action": "appendPoint",
-            "label": label,
-            "value": value
-        }
-        js = f"window.handlePythonMessage({json.dumps(data)});"
-        self.view.page().runJavaScript(js)
+        self._pending_points.append({"label": label, "value": value})
+        if len(self._pending_points) >= BATCH_SIZE:
+            self.flush_points()
+        elif not self.flush_timer.isActive():
+            self.flush_timer.start()
+
+    def flush_points(self):
+        self.flush_timer.stop()
+        if not self._pending_points:
+            return
+        data = {"action": "appendBatch", "points": self._pending_points}
+        self.bridge.pyToJs.emit(json.dumps(data))
+        self._pending_points = []
 
     def clear_chart(self):
-        data = {"action": "clear"}
-        self.view.page().runJavaScript(f"window.handlePythonMessage({json.dumps(data)});")
+        self.flush_timer.stop()
+        self._pending_points = []
+        self.bridge.pyToJs.emit(json.dumps({"action": "clear"}))
         self._labels = []
 
     @staticmethod
     def _html() -> str:
         # Chart.js v4 CDN used; qwebchannel.js is loaded from qt resource
-        # The page exposes window.handlePythonMessage(data) to accept Python pushes
+        # The page connects bridge.pyToJs to window.handlePythonMessage(json), which
+        # handles {"action": "appendBatch", "points": [...]} and {"action": "clear"}
         return """
 
         """
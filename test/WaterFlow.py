@@ -1,13 +1,23 @@
+from collections import deque
 from PyQt6.QtWidgets import QWidget
 from PyQt6.QtGui import QPainter, QColor, QLinearGradient, QBrush
 from PyQt6.QtCore import Qt, QTimer, QPointF
 
+RIPPLE_SPEED = 4         # radius growth per frame
+RIPPLE_MAX_RADIUS = 150
+
+
 class AquaRippleWidget(QWidget):
     def __init__(self):
         super().__init__()
         self.setWindowFlag(Qt.WindowType.WindowCloseButtonHint, True)
         self.setMinimumSize(600, 600)
-        self.ripples = []  # list of dicts: x, y, radius, max_radius, speed
+        # (x, y, birth frame); every ripple grows at the same speed, so the
+        # radius follows from the frame counter and the oldest expire first
+        self.ripples = deque()
+        self.frame = 0
+        self._bg_brush = None  # depends only on height, rebuilt on resize
+        self._ripple_colors = [QColor(0, 255, 255, a) for a in range(256)]  # aqua by alpha
 
         self.timer = QTimer()
         self.timer.timeout.connect(self.update_ripples)
@@ -15,37 +25,36 @@ class AquaRippleWidget(QWidget):
 
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
-            self.ripples.append({
-                'x': event.position().x(),
-                'y': event.position().y(),
-                'radius': 0,
-                'max_radius': 150,
-                'speed': 4
-            })
+            pos = event.position()
+            self.ripples.append((pos.x(), pos.y(), self.frame))
 
     def update_ripples(self):
-        new_ripples = []
-        for r in self.ripples:
-            r['radius'] += r['speed']
-            if r['radius'] <= r['max_radius']:
-                new_ripples.append(r)
-        self.ripples = new_ripples
+        self.frame += 1
+        oldest = self.frame - RIPPLE_MAX_RADIUS // RIPPLE_SPEED
+        while self.ripples and self.ripples[0][2] < oldest:
+            self.ripples.popleft()
         self.update()
 
+    def resizeEvent(self, event):
+        self._bg_brush = None
+        super().resizeEvent(event)
+
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         # Water-like gradient background
-        gradient = QLinearGradient(0, 0, 0, self.height())
-        gradient.setColorAt(0, QColor(0, 100, 180))   # dark aqua top
-        gradient.setColorAt(1, QColor(0, 200, 255))   # lighter aqua bottom
-        painter.fillRect(self.rect(), QBrush(gradient))
+        if self._bg_brush is None:
+            gradient = QLinearGradient(0, 0, 0, self.height())
+            gradient.setColorAt(0, QColor(0, 100, 180))   # dark aqua top
+            gradient.setColorAt(1, QColor(0, 200, 255))   # lighter aqua bottom
+            self._bg_brush = QBrush(gradient)
+        painter.fillRect(self.rect(), self._bg_brush)
 
         # Draw ripples
-        for r in self.ripples:
-            alpha = max(0, 180 - int((r['radius']/r['max_radius'])*180))  # fade out
-            color = QColor(0, 255, 255, alpha)  # aqua color
-            painter.setPen(color)
-            painter.setBrush(Qt.BrushStyle.NoBrush)
-            painter.drawEllipse(QPointF(r['x'], r['y']), r['radius'], r['radius'])
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        for x, y, birth in self.ripples:
+            radius = (self.frame - birth) * RIPPLE_SPEED
+            alpha = max(0, 180 - int((radius/RIPPLE_MAX_RADIUS)*180))  # fade out
+            painter.setPen(self._ripple_colors[alpha])
+            painter.drawEllipse(QPointF(x, y), radius, radius)
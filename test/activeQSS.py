@@ -1,7 +1,83 @@
 import sys
 import os
-from PyQt6.QtCore import QTimer
-from PyQt6.QtWidgets import QApplication, QWidget, QTextEdit, QVBoxLayout
+import codecs
+import hashlib
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+from PyQt6.QtGui import QTextCursor
+from PyQt6.QtWidgets import QWidget, QTextEdit, QVBoxLayout
+
+from libs.Sharedwatcher import SharedFSWatcher
+
+TAIL_CHECK = 64  # bytes before the old end that must be unchanged to append
+MAX_BLOCKS = 10_000  # lines kept in the viewer; older ones are dropped on append
+READ_CHUNK = 64 * 1024
+
+
+def file_ident(st: os.stat_result) -> tuple[int, int, int, int]:
+    """(st_dev, st_ino, st_size, st_mtime_ns): any change means the file must be re-read."""
+    return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+class FileReaderSignals(QObject):
+    # stat result (None if the read failed), decoded text (the error when a
+    # read of an existing file failed), appended?, end offset,
+    # last TAIL_CHECK bytes up to the offset, digest of a full read
+    loaded = pyqtSignal(object, str, bool, int, bytes, bytes)
+
+
+class FileReader(QRunnable):
+    """Reads the watched file on a pool thread so large files don't block the GUI."""
+
+    def __init__(self, filepath, offset, tail, st=None):
+        super().__init__()
+        self.filepath = filepath
+        self.offset = offset
+        self.tail = tail
+        self.st = st  # stat that detected the change, reused instead of stat'ing again
+        self.signals = FileReaderSignals()
+
+    def run(self):
+        try:
+            st = self.st if self.st is not None else os.stat(self.filepath)
+            with open(self.filepath, "rb") as f:
+                appended = self._is_append(f, st.st_size)
+                if not appended:
+                    f.seek(0)
+                text, tail, digest, held = self._decode(f, appended)
+                # An incomplete UTF-8 sequence at the end is read again next time
+                offset = f.tell() - held
+        except FileNotFoundError:
+            self.signals.loaded.emit(None, "", False, 0, b"", b"")
+            return
+        except OSError as e:
+            # Locked mid-save, no permission, a directory...: always report back,
+            # or the watcher would wait for this reader forever
+            self.signals.loaded.emit(None, str(e), False, 0, b"", b"")
+            return
+        self.signals.loaded.emit(st, text, appended, offset, tail, digest)
+
+    def _is_append(self, f, size):
+        """True if the file only grew past the shown content; leaves `f` at the old end."""
+        if not self.tail or size <= self.offset:
+            return False
+        f.seek(self.offset - len(self.tail))
+        return f.read(len(self.tail)) == self.tail
+
+    def _decode(self, f, appended):
+        """Decode from the current position in READ_CHUNK pieces, never holding the whole file as bytes."""
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+        digest = None if appended else hashlib.blake2b(digest_size=16)
+        tail = self.tail if appended else b""
+        parts = []
+        while chunk := f.read(READ_CHUNK):
+            parts.append(decoder.decode(chunk))
+            tail = (tail + chunk)[-(TAIL_CHECK + 4):]
+            if digest is not None:
+                digest.update(chunk)
+        held = len(decoder.getstate()[0])
+        if held:
+            tail = tail[:-held]
+        return "".join(parts), tail[-TAIL_CHECK:], digest.digest() if digest else b"", held
 
 
 class FileWatcher(QWidget):
@@ -9,44 +85,116 @@ class FileWatcher(QWidget):
         super().__init__()
 
         self.filepath = filepath
-        self.last_mtime = None
+        self._ident = None    # file_ident() of the loaded content
+        self._digest = None   # content digest of the last full load
+        self._offset = 0      # bytes already shown
+        self._tail = b""      # last TAIL_CHECK bytes shown, to recognise a pure append
+        self._reader = None   # in-flight FileReader
+        self._reload_again = False  # a change arrived while reading
+        self._missing = False  # negative cache: known absent until the directory changes
 
         layout = QVBoxLayout(self)
         self.viewer = QTextEdit()
         self.viewer.setReadOnly(True)
+        # Plain text only, and a read-only viewer needs no undo stack
+        self.viewer.setAcceptRichText(False)
+        self.viewer.setUndoRedoEnabled(False)
+        self.viewer.document().setMaximumBlockCount(MAX_BLOCKS)
         layout.addWidget(self.viewer)
 
-        # --- QTimer setup ---
-        self.timer = QTimer(self)
-        self.timer.setInterval(1000)  # check every 1 sec
-        self.timer.timeout.connect(self.check_file)
-        self.timer.start()
+        # One editor save emits several events; collapse them into one check
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(50)
+        self._debounce.timeout.connect(self.check_file)
+
+        # --- Watcher setup ---
+        # The kernel reports changes, nothing runs while the file is idle.
+        # The process-wide watcher re-arms the file after atomic saves; the
+        # parent directory is registered too, for files created or deleted.
+        watcher = SharedFSWatcher.instance()
+        watcher.register(self.filepath, self._on_file_changed, owner=self)
+        watcher.register(os.path.dirname(os.path.abspath(self.filepath)), self._on_dir_changed, owner=self)
 
         self.load_file()
 
-    def load_file(self):
-        if not os.path.exists(self.filepath):
-            self.viewer.setText("File not found")
+    def load_file(self, st: os.stat_result | None = None):
+        # One read at a time; changes during a read collapse into one more read
+        if self._reader is not None:
+            self._reload_again = True
             return
+        self._reader = FileReader(self.filepath, self._offset, self._tail, st)
+        self._reader.signals.loaded.connect(self._on_loaded)
+        QThreadPool.globalInstance().start(self._reader)
+
+    def _on_loaded(self, st, text, appended, offset, tail, digest):
+        self._reader = None
+        if st is None and text:
+            # Unreadable for now: keep the document, the next change reloads in full
+            print(f"Could not read file: {text}")
+            self._ident = None
+        elif st is None:
+            self.viewer.setPlainText("File not found")
+            self._offset, self._tail = 0, b""
+            self._ident = self._digest = None
+        else:
+            if appended:
+                # Grown log: only the new tail is laid out
+                self.viewer.moveCursor(QTextCursor.MoveOperation.End)
+                self.viewer.insertPlainText(text)
+                self._digest = None
+            elif digest != self._digest:
+                # Truncated, rotated or edited: full reload. Plain text skips
+                # the HTML sniffing of setText.
+                self.viewer.setPlainText(text)
+                self._digest = digest
+            # else: touched or re-saved with identical bytes, keep the document
+            self._offset = offset
+            self._tail = tail
+            # integer ns mtime, no float rounding
+            self._ident = file_ident(st)
 
-        with open(self.filepath, "r", encoding="utf-8", errors="ignore") as f:
-            content = f.read()
-        self.viewer.setText(content)
+        if self._reload_again:
+            self._reload_again = False
+            self.check_file()
 
-        # update stored mtime
-        self.last_mtime = os.path.getmtime(self.filepath)
+    def _on_file_changed(self, _path):
+        self._debounce.start()
+
+    def _on_dir_changed(self, _path):
+        # Only a directory change can bring a missing file back
+        self._missing = False
+        self._debounce.start()
 
     def check_file(self):
-        if not os.path.exists(self.filepath):
+        if self._missing:
+            return
+        try:
+            st = os.stat(self.filepath)
+        except FileNotFoundError:
+            self._missing = True
+            return
+        except OSError as e:
+            print(f"Could not stat file: {e}")  # retried on the next change
             return
 
-        current_mtime = os.path.getmtime(self.filepath)
-        if self.last_mtime is None or current_mtime != self.last_mtime:
-            self.load_file()  # re-read file
+        ident = file_ident(st)
+        if ident == self._ident:
+            return
+        if self._ident is None or ident[:2] != self._ident[:2]:
+            # Replaced by an atomic save: the old offset means nothing for the new
+            # inode, even when size and mtime happen to match
+            self._offset, self._tail = 0, b""
+            self.load_file(st)
+            print("File replaced — reloaded")
+        else:
+            self.load_file(st)  # re-read file
             print("File updated — reloaded")
 
 
 if __name__ == "__main__":
+    from PyQt6.QtWidgets import QApplication
+
     app = QApplication(sys.argv)
     w = FileWatcher("test.txt")   # <- change file path
     w.resize(400, 300)
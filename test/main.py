@@ -1,4 +1,4 @@
-from PyQt6.QtWidgets import QApplication, QWidget, QLabel, QComboBox, QVBoxLayout, QPushButton
+from PyQt6.QtWidgets import QWidget, QLabel, QComboBox, QVBoxLayout, QPushButton
 from PyQt6.QtCore import Qt
 import sys
 import os
@@ -20,10 +20,11 @@ class AlarmClock(QWidget):
         self.last_mtime = None
 
         self.initUI()
+        # Live reload only fires on a save, so apply the current QSS once now
+        self.style_watcher.apply_stylesheet()
 
     def initUI(self):
-        main_layout = QVBoxLayout()
-        self.setLayout(main_layout)
+        main_layout = QVBoxLayout(self)
 
         self.label = QLabel("00:00:00")
         self.label.setAlignment(Qt.AlignmentFlag.AlignHCenter)
@@ -39,7 +40,9 @@ class AlarmClock(QWidget):
 
 
 
-if __name__ == f"__main__":
+if __name__ == "__main__":
+    from PyQt6.QtWidgets import QApplication
+
     app = QApplication(sys.argv)
     win = AlarmClock()
     win.show()